@@ -2,115 +2,88 @@
 
 
 import csv
+import functools
+import heapq
+import io
+import itertools
+import operator
+import os
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from collections import Counter, defaultdict
 import argparse
 
+try:
+    import numpy as np
+    import pandas as pd
+    _HAS_PANDAS = True
+except ImportError:
+    # 没装pandas时退回纯标准库的逐行解析
+    _HAS_PANDAS = False
+
+try:
+    import ciso8601
+    _HAS_CISO8601 = True
+except ImportError:
+    _HAS_CISO8601 = False
+
+_DATE_FORMATS = [
+    '%m/%d/%Y %I:%M:%S %p',  # 12/12/2025 3:30:19 PM
+    '%Y-%m-%d %H:%M:%S',     # 2025-12-12 15:30:19
+    '%m/%d/%Y',              # 12/12/2025
+    '%Y-%m-%d'               # 2025-12-12
+]
+# 记住上一次命中的格式：同一份数据基本只有一种格式，
+# 避免每行都靠ValueError逐个试错
+_last_fmt_idx = 0
+
+# 状态归类集合：O(1)哈希查找，代替每行小写后线性扫列表
+OPEN_STATES = frozenset({'new', 'active', 'open', 'in progress'})
+CLOSED_STATES = frozenset({'closed', 'resolved', 'done'})
+
 def parse_date(date_str):
     """解析多种日期格式"""
+    global _last_fmt_idx
+
     if not date_str or date_str.strip() == '':
         return None
-    
+
     date_str = date_str.strip()
-    
-    # 尝试不同的日期格式
-    date_formats = [
-        '%m/%d/%Y %I:%M:%S %p',  # 12/12/2025 3:30:19 PM
-        '%Y-%m-%d %H:%M:%S',     # 2025-12-12 15:30:19
-        '%m/%d/%Y',              # 12/12/2025
-        '%Y-%m-%d'               # 2025-12-12
-    ]
-    
-    for fmt in date_formats:
+
+    # ISO格式（2025-12-12...）优先走C实现的解析器
+    if _HAS_CISO8601 and len(date_str) > 4 and date_str[4] == '-':
         try:
-            return datetime.strptime(date_str, fmt)
+            return ciso8601.parse_datetime(date_str)
         except ValueError:
+            pass
+
+    # 先试上次成功的格式
+    try:
+        return datetime.strptime(date_str, _DATE_FORMATS[_last_fmt_idx])
+    except ValueError:
+        pass
+
+    for i, fmt in enumerate(_DATE_FORMATS):
+        if i == _last_fmt_idx:
             continue
-    
+        try:
+            result = datetime.strptime(date_str, fmt)
+            _last_fmt_idx = i
+            return result
+        except ValueError:
+            continue
+
     print(f"警告：无法解析日期: {date_str}")
     return None
 
 def parse_csv_file(csv_file_path):
     """解析CSV文件并返回工作项数据"""
-    work_items = []
-    
     try:
-        with open(csv_file_path, 'r', encoding='utf-8-sig') as file:
-            # 使用DictReader按列名访问数据
-            reader = csv.DictReader(file)
-            
-            # 检查必要的列是否存在
-            required_columns = ['ID', 'Work Item Type', 'Title', 'State', 'Created Date']
-            for col in required_columns:
-                if col not in reader.fieldnames:
-                    print(f"错误：CSV文件中缺少必需的列：{col}")
-                    print(f"找到的列：{reader.fieldnames}")
-                    return []
-            
-            print(f"找到的列：{list(reader.fieldnames)}")
-            
-            # 读取每一行数据
-            for row_num, row in enumerate(reader, 1):
-                try:
-                    # 解析日期
-                    created_date = parse_date(row['Created Date'])
-                    closed_date = parse_date(row.get('Closed Date', ''))
-                    
-                    # 解析指派给（移除邮箱部分）
-                    assigned_to = row.get('Assigned To', '').split('<')[0].strip() if row.get('Assigned To') else 'Unassigned'
-                    
-                    # 解析区域路径
-                    area_path = row.get('Area Path', '')
-                    
-                    # 获取最后一部分作为团队/模块
-                    if area_path:
-                        area_parts = area_path.split('\\')
-                        team = area_parts[-1] if area_parts else area_path
-                    else:
-                        team = 'Unknown'
-                    
-                    # 计算解决时间（如果已关闭）
-                    resolution_time = None
-                    if closed_date and created_date:
-                        resolution_time = (closed_date - created_date).days
-                    
-                    # 解析Story Points
-                    story_points = 0
-                    try:
-                        if row.get('Story Points'):
-                            story_points = float(row['Story Points'])
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    # 创建工作项对象
-                    work_item = {
-                        'id': row['ID'],
-                        'type': row['Work Item Type'],
-                        'title': row['Title'],
-                        'assigned_to': assigned_to,
-                        'state': row['State'],
-                        'tags': row.get('Tags', '').split(';') if row.get('Tags') else [],
-                        'created_date': created_date,
-                        'priority': row.get('Priority', 'Not Set'),
-                        'closed_date': closed_date,
-                        'story_points': story_points,
-                        'area_path': area_path,
-                        'team': team,
-                        'resolution_days': resolution_time
-                    }
-                    
-                    work_items.append(work_item)
-                    
-                except KeyError as e:
-                    print(f"警告：第{row_num}行缺少字段：{e}")
-                except Exception as e:
-                    print(f"警告：第{row_num}行解析失败：{e}")
-                    print(f"行数据：{row}")
-                    
-        print(f"成功解析 {len(work_items)} 个工作项")
-        return work_items
-        
+        if _HAS_PANDAS:
+            return _parse_csv_pandas(csv_file_path)
+        return _parse_csv_stdlib(csv_file_path)
+
     except FileNotFoundError:
         print(f"错误：文件 '{csv_file_path}' 未找到")
         sys.exit(1)
@@ -123,11 +96,523 @@ def parse_csv_file(csv_file_path):
         traceback.print_exc()
         sys.exit(1)
 
+def _parse_dates_bulk(series):
+    """整列批量解析日期：先按主导格式试，NaT过多再退回format='mixed'"""
+    parsed = pd.to_datetime(series, format=_DATE_FORMATS[0], cache=True, errors='coerce')
+    # 固定格式没覆盖住的列（混合格式数据）用mixed重解析一遍；
+    # 只数解析新产生的NaT——本来就是空的单元格不算解析失败，
+    # 否则稀疏列（如多数未关闭的Closed Date）永远走慢路径
+    if (parsed.isna().sum() - series.isna().sum()) > series.notna().sum() * 0.1:
+        parsed = pd.to_datetime(series, format='mixed', cache=True, errors='coerce')
+    return parsed
+
+_REQUIRED_COLUMNS = ['ID', 'Work Item Type', 'Title', 'State', 'Created Date']
+# Story Points按字符串读入：脏值（如"TBD"）交给_normalize_df里的
+# to_numeric(errors='coerce')处理，读取阶段强转float会直接抛ValueError
+_READ_KWARGS = dict(
+    encoding='utf-8-sig',
+    dtype={'ID': 'string', 'Priority': 'string', 'Story Points': 'string'},
+)
+
+def _normalize_df(df):
+    """把原始CSV列转成分析用的规范列；缺少必需列时返回None"""
+    for col in _REQUIRED_COLUMNS:
+        if col not in df.columns:
+            return None
+
+    # 补齐可选列，避免后面逐列判断
+    for col in ('Assigned To', 'Area Path', 'Tags', 'Priority'):
+        if col not in df.columns:
+            df[col] = ''
+    if 'Closed Date' not in df.columns:
+        df['Closed Date'] = pd.NaT
+    if 'Story Points' not in df.columns:
+        df['Story Points'] = 0.0
+
+    # 向量化列变换：一次处理整列而不是每行一次
+    assigned_to = df['Assigned To'].fillna('').str.split('<', n=1).str[0].str.strip()
+    assigned_to = assigned_to.where(assigned_to != '', 'Unassigned')
+
+    area_path = df['Area Path'].fillna('')
+    team = area_path.str.rsplit('\\', n=1).str[-1]
+    team = team.where(area_path != '', 'Unknown')
+
+    story_points = pd.to_numeric(df['Story Points'], errors='coerce').fillna(0.0)
+
+    # 日期整列批量解析（pandas会缓存重复的日期字符串）
+    created_date = _parse_dates_bulk(df['Created Date'])
+    closed_date = _parse_dates_bulk(df['Closed Date'])
+    resolution_days = (closed_date - created_date).dt.days
+
+    out = pd.DataFrame({
+        'id': df['ID'].fillna('').astype(str),
+        'type': df['Work Item Type'],
+        'title': df['Title'],
+        'assigned_to': assigned_to,
+        'state': df['State'],
+        'tags': df['Tags'].fillna('').map(lambda t: t.split(';') if t else []),
+        'created_date': created_date,
+        # 空优先级统一表示成''：stdlib路径里空单元格本来就是''，
+        # 两条解析路径的输出必须一致
+        'priority': df['Priority'].fillna('').astype(str),
+        'closed_date': closed_date,
+        'story_points': story_points.astype('float32'),
+        'area_path': area_path,
+        'team': team,
+        'resolution_days': resolution_days,
+    })
+    # 低基数字符串列转分类类型：按整数码存储和分组，
+    # 大数据集下内存降一个量级，聚合也更快
+    for col in ('type', 'state', 'priority', 'assigned_to', 'team'):
+        out[col] = out[col].astype('category')
+    return out
+
+def _parse_csv_pandas(csv_file_path):
+    """用pandas按列批量解析CSV，替代逐行的Python解析"""
+    try:
+        # pyarrow引擎最快，不可用时退回C引擎
+        df = pd.read_csv(csv_file_path, engine='pyarrow', **_READ_KWARGS)
+    except (ImportError, ValueError):
+        df = pd.read_csv(csv_file_path, **_READ_KWARGS)
+
+    out = _normalize_df(df)
+    if out is None:
+        missing = [c for c in _REQUIRED_COLUMNS if c not in df.columns]
+        print(f"错误：CSV文件中缺少必需的列：{missing[0]}")
+        print(f"找到的列：{list(df.columns)}")
+        return []
+
+    print(f"找到的列：{list(df.columns)}")
+    print(f"成功解析 {len(out)} 个工作项")
+    # 直接把DataFrame往下传，分析阶段走向量化路径
+    return out
+
+@dataclass(slots=True)
+class WorkItem:
+    """单个工作项。
+
+    slots布局一行只占固定槽位，比14个键的dict省约一半内存，
+    字段读取也是定偏移访问而不是哈希查找。
+    """
+    id: str
+    type: str
+    title: str
+    assigned_to: str
+    state: str
+    state_lc: str
+    tags: list
+    created_date: object
+    priority: str
+    closed_date: object
+    story_points: float
+    area_path: str
+    team: str
+    resolution_days: object
+
+    def __getitem__(self, key):
+        # 兼容DataFrame路径的记录式访问（item['story_points']）
+        return getattr(self, key)
+
+def _parse_csv_stdlib(csv_file_path):
+    """标准库csv的逐行解析（pandas不可用时的后备路径）"""
+    work_items = []
+
+    # 1MiB读缓冲：大文件时减少read系统调用次数
+    with open(csv_file_path, 'rb', buffering=1 << 20) as raw:
+        file = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+        # csv.reader按位置取列，省掉DictReader每行建一个dict的开销
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            print("错误：CSV文件为空")
+            return []
+
+        # 检查必要的列是否存在
+        required_columns = ['ID', 'Work Item Type', 'Title', 'State', 'Created Date']
+        for col in required_columns:
+            if col not in header:
+                print(f"错误：CSV文件中缺少必需的列：{col}")
+                print(f"找到的列：{header}")
+                return []
+
+        print(f"找到的列：{header}")
+
+        # 列下标取一次，循环里直接按位置访问
+        def col_idx(name):
+            return header.index(name) if name in header else None
+
+        i_id = header.index('ID')
+        i_type = header.index('Work Item Type')
+        i_title = header.index('Title')
+        i_state = header.index('State')
+        i_created = header.index('Created Date')
+        i_closed = col_idx('Closed Date')
+        i_assigned = col_idx('Assigned To')
+        i_area = col_idx('Area Path')
+        i_tags = col_idx('Tags')
+        i_priority = col_idx('Priority')
+        i_points = col_idx('Story Points')
+
+        # 读取每一行数据
+        for row_num, row in enumerate(reader, 1):
+            try:
+                # 解析日期
+                created_date = parse_date(row[i_created])
+                closed_date = parse_date(row[i_closed] if i_closed is not None else '')
+
+                # 解析指派给（移除邮箱部分）
+                # partition返回三元组，不像split那样每行新建一个列表
+                raw_assigned = row[i_assigned] if i_assigned is not None else ''
+                assigned_to = raw_assigned.partition('<')[0].strip() if raw_assigned else 'Unassigned'
+
+                # 解析区域路径，最后一段作为团队/模块
+                area_path = row[i_area] if i_area is not None else ''
+                if area_path:
+                    team = area_path.rpartition('\\')[2] or area_path
+                else:
+                    team = 'Unknown'
+
+                # 计算解决时间（如果已关闭）
+                resolution_time = None
+                if closed_date and created_date:
+                    resolution_time = (closed_date - created_date).days
+
+                # 解析Story Points：先看首字符再转float，
+                # 避免空值/非数字走异常路径（抛异常比分支判断贵得多）
+                story_points = 0
+                sp_raw = row[i_points].strip() if i_points is not None else ''
+                if sp_raw and (sp_raw[0].isdigit() or sp_raw[0] in '-+.'):
+                    try:
+                        story_points = float(sp_raw)
+                    except ValueError:
+                        pass
+
+                state = row[i_state]
+                tags_raw = row[i_tags] if i_tags is not None else ''
+
+                # 创建工作项对象
+                work_item = WorkItem(
+                    id=row[i_id],
+                    type=row[i_type],
+                    title=row[i_title],
+                    assigned_to=assigned_to,
+                    state=state,
+                    # 小写状态在解析时算好，分析阶段直接用
+                    state_lc=state.lower(),
+                    tags=tags_raw.split(';') if tags_raw else [],
+                    created_date=created_date,
+                    priority=row[i_priority] if i_priority is not None else '',
+                    closed_date=closed_date,
+                    story_points=story_points,
+                    area_path=area_path,
+                    team=team,
+                    resolution_days=resolution_time
+                )
+
+                work_items.append(work_item)
+
+            except IndexError as e:
+                print(f"警告：第{row_num}行缺少字段：{e}")
+            except Exception as e:
+                print(f"警告：第{row_num}行解析失败：{e}")
+                print(f"行数据：{row}")
+
+    print(f"成功解析 {len(work_items)} 个工作项")
+    return work_items
+
 def analyze_work_items(work_items):
     """分析工作项数据"""
-    if not work_items:
+    if work_items is None or len(work_items) == 0:
         return {}
-    
+
+    if _HAS_PANDAS and isinstance(work_items, pd.DataFrame):
+        if len(work_items) >= _PARALLEL_MIN_ROWS and (os.cpu_count() or 1) > 1:
+            return _analyze_df_parallel(work_items)
+        return _analyze_df(work_items)
+    return _analyze_rows(work_items)
+
+def _priority_sort_keys(priority_labels):
+    """每个优先级标签算一次整数排序键（非数字的排最后）"""
+    return {p: int(p) if p.isdigit() else 999 for p in priority_labels}
+
+def _group_counts_and_sums(values, weights):
+    """按分类码做一次C级bincount，同时得到每组条数和权重和。
+
+    字符串列先转Categorical，之后的聚合都发生在整数码上，
+    比按字符串哈希的groupby省一次散列。
+    """
+    cat = pd.Categorical(values)
+    codes = cat.codes
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=len(cat.categories))
+    sums = np.bincount(codes[valid], weights=weights[valid], minlength=len(cat.categories))
+    count_dict = {k: int(c) for k, c in zip(cat.categories, counts)}
+    sum_dict = {k: float(s) for k, s in zip(cat.categories, sums)}
+    return count_dict, sum_dict
+
+def _analyze_df(df):
+    """基于DataFrame的向量化分析：按列做C级归约代替逐行循环"""
+    story_points = df['story_points'].to_numpy(dtype='float64')
+    type_counts, type_sums = _group_counts_and_sums(df['type'], story_points)
+    team_counts, team_sums = _group_counts_and_sums(df['team'], story_points)
+    assignee_counts, assignee_sums = _group_counts_and_sums(df['assigned_to'], story_points)
+
+    analysis = {
+        'total_items': len(df),
+        'type_distribution': Counter(type_counts),
+        'state_distribution': Counter(df['state'].value_counts().to_dict()),
+        'priority_distribution': Counter(df['priority'].value_counts().to_dict()),
+        'team_distribution': Counter(team_counts),
+        'assignee_distribution': Counter(assignee_counts),
+        'open_items': [],
+        'closed_items': [],
+        'resolution_times': [],
+        'story_points_total': float(story_points.sum()),
+        'story_points_by_team': defaultdict(float, team_sums),
+        'story_points_by_assignee': defaultdict(float, assignee_sums),
+        'story_points_by_type': defaultdict(float, type_sums),
+        'largest_story_items': [],
+        'oldest_open_item': None,
+        'newest_item': None
+    }
+
+    state_lc = df['state'].str.lower()
+    open_mask = state_lc.isin(OPEN_STATES)
+    closed_mask = state_lc.isin(CLOSED_STATES)
+
+    analysis['open_items'] = df[open_mask].to_dict('records')
+    analysis['closed_items'] = df[closed_mask].to_dict('records')
+
+    resolution_times = df.loc[closed_mask, 'resolution_days'].dropna().astype(int)
+    analysis['resolution_times'] = resolution_times.tolist()
+    if len(resolution_times):
+        analysis['avg_resolution_time'] = float(resolution_times.mean())
+        analysis['max_resolution_time'] = int(resolution_times.max())
+        analysis['min_resolution_time'] = int(resolution_times.min())
+
+    # 不预排序：排名阶段用nlargest按需取top-N
+    largest = df.loc[df['story_points'] > 0,
+                     ['id', 'title', 'story_points', 'type', 'state', 'assigned_to', 'team']]
+    analysis['largest_story_items'] = largest.to_dict('records')
+
+    created = df['created_date']
+    # idxmax/idxmin在int64的datetime64值上做C级扫描，NaT自动跳过
+    if created.count():
+        newest = df.loc[created.idxmax()]
+        title = newest['title']
+        analysis['newest_item'] = {
+            'id': newest['id'],
+            'date': newest['created_date'],
+            'title': title[:50] + '...' if len(title) > 50 else title,
+            'type': newest['type'],
+            'story_points': newest['story_points']
+        }
+
+    open_created = created[open_mask]
+    if open_created.count():
+        oldest = df.loc[open_created.idxmin()]
+        title = oldest['title']
+        analysis['oldest_open_item'] = {
+            'id': oldest['id'],
+            'date': oldest['created_date'],
+            'title': title[:50] + '...' if len(title) > 50 else title,
+            'age_days': (datetime.now() - oldest['created_date']).days,
+            'priority': oldest['priority'],
+            'story_points': oldest['story_points']
+        }
+
+    analysis['priority_sort_keys'] = _priority_sort_keys(analysis['priority_distribution'])
+    return analysis
+
+# 行数超过阈值才值得切片进进程池：序列化分片有固定开销
+_PARALLEL_MIN_ROWS = 500_000
+
+def _merge_partials(a, b):
+    """合并两个分片的分析结果。所有聚合都满足结合律，
+    按任意顺序归约得到与单遍分析相同的字典。"""
+    a['total_items'] += b['total_items']
+    for key in ('type_distribution', 'state_distribution', 'priority_distribution',
+                'team_distribution', 'assignee_distribution'):
+        a[key].update(b[key])
+    a['story_points_total'] += b['story_points_total']
+    for key in ('story_points_by_team', 'story_points_by_assignee', 'story_points_by_type'):
+        bucket = a[key]
+        for k, v in b[key].items():
+            bucket[k] += v
+    for key in ('open_items', 'closed_items', 'resolution_times', 'largest_story_items'):
+        a[key].extend(b[key])
+    if b['newest_item'] and (
+            not a['newest_item'] or b['newest_item']['date'] > a['newest_item']['date']):
+        a['newest_item'] = b['newest_item']
+    if b['oldest_open_item'] and (
+            not a['oldest_open_item'] or b['oldest_open_item']['date'] < a['oldest_open_item']['date']):
+        a['oldest_open_item'] = b['oldest_open_item']
+    a['priority_sort_keys'].update(b.get('priority_sort_keys', {}))
+    return a
+
+def _analyze_df_parallel(df):
+    """大数据帧按CPU核数切片，进程池里各自归约再两两合并"""
+    from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+
+    n_workers = min(os.cpu_count() or 1, 8)
+    # 按位置边界用iloc切片：np.array_split会把DataFrame当ndarray处理，
+    # pandas 3.0下直接崩
+    bounds = np.linspace(0, len(df), n_workers + 1, dtype=int)
+    shards = [df.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:]) if lo < hi]
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            partials = list(pool.map(_analyze_df, shards))
+    except (OSError, PermissionError, BrokenExecutor):
+        # 受限环境起不了子进程、或池挂掉时退回单进程路径
+        return _analyze_df(df)
+
+    analysis = functools.reduce(_merge_partials, partials)
+    # 分片内的均值/极值在合并后失效，基于合并结果重算
+    resolution_times = analysis['resolution_times']
+    for key in ('avg_resolution_time', 'max_resolution_time', 'min_resolution_time'):
+        analysis.pop(key, None)
+    if resolution_times:
+        analysis['avg_resolution_time'] = sum(resolution_times) / len(resolution_times)
+        analysis['max_resolution_time'] = max(resolution_times)
+        analysis['min_resolution_time'] = min(resolution_times)
+    return analysis
+
+# 流式分析的参数：分块行数和触发流式路径的文件大小
+_STREAM_CHUNK_ROWS = 100_000
+_STREAM_SIZE_THRESHOLD = 64 * 1024 * 1024
+
+def analyze_csv_streaming(csv_file_path, chunksize=_STREAM_CHUNK_ROWS, top_n=20):
+    """分块流式读取CSV并在线聚合分析结果。
+
+    内存占用只和块大小相关，不随总行数增长：
+    分布用Counter累加，最大Story Points项只保留top_n的堆，
+    明细列表（open/closed）只保留下游真正用到的窄列。
+    """
+    analysis = {
+        'total_items': 0,
+        'type_distribution': Counter(),
+        'state_distribution': Counter(),
+        'priority_distribution': Counter(),
+        'team_distribution': Counter(),
+        'assignee_distribution': Counter(),
+        'open_items': [],
+        'closed_items': [],
+        'resolution_times': [],
+        'story_points_total': 0,
+        'story_points_by_team': defaultdict(float),
+        'story_points_by_assignee': defaultdict(float),
+        'story_points_by_type': defaultdict(float),
+        'largest_story_items': [],
+        'oldest_open_item': None,
+        'newest_item': None
+    }
+
+    largest_heap = []
+    tie = itertools.count()
+    res_count, res_sum = 0, 0.0
+    res_max, res_min = None, None
+    newest, oldest_open = None, None
+
+    try:
+        reader = pd.read_csv(csv_file_path, chunksize=chunksize, low_memory=False, **_READ_KWARGS)
+    except FileNotFoundError:
+        print(f"错误：文件 '{csv_file_path}' 未找到")
+        sys.exit(1)
+    except PermissionError:
+        print(f"错误：没有权限读取文件 '{csv_file_path}'")
+        sys.exit(1)
+
+    for chunk in reader:
+        df = _normalize_df(chunk)
+        if df is None:
+            missing = [c for c in _REQUIRED_COLUMNS if c not in chunk.columns]
+            print(f"错误：CSV文件中缺少必需的列：{missing[0]}")
+            print(f"找到的列：{list(chunk.columns)}")
+            return {}
+
+        analysis['total_items'] += len(df)
+        analysis['type_distribution'].update(df['type'].value_counts().to_dict())
+        analysis['state_distribution'].update(df['state'].value_counts().to_dict())
+        analysis['priority_distribution'].update(df['priority'].value_counts().to_dict())
+        analysis['team_distribution'].update(df['team'].value_counts().to_dict())
+        analysis['assignee_distribution'].update(df['assigned_to'].value_counts().to_dict())
+
+        analysis['story_points_total'] += float(df['story_points'].sum())
+        for key, col in (('story_points_by_team', 'team'),
+                         ('story_points_by_assignee', 'assigned_to'),
+                         ('story_points_by_type', 'type')):
+            for name, points in df.groupby(col, sort=False)['story_points'].sum().items():
+                analysis[key][name] += float(points)
+
+        state_lc = df['state'].str.lower()
+        open_mask = state_lc.isin(OPEN_STATES)
+        closed_mask = state_lc.isin(CLOSED_STATES)
+
+        # 只保留下游消费的列，避免全宽记录撑爆内存
+        analysis['open_items'].extend(
+            df.loc[open_mask, ['id', 'title', 'story_points', 'assigned_to', 'state']].to_dict('records'))
+        analysis['closed_items'].extend(
+            df.loc[closed_mask, ['id', 'story_points']].to_dict('records'))
+
+        res = df.loc[closed_mask, 'resolution_days'].dropna()
+        if len(res):
+            res_count += len(res)
+            res_sum += float(res.sum())
+            chunk_max, chunk_min = int(res.max()), int(res.min())
+            res_max = chunk_max if res_max is None else max(res_max, chunk_max)
+            res_min = chunk_min if res_min is None else min(res_min, chunk_min)
+
+        # 最大Story Points项：块内先取top_n，再合并进全局堆
+        pos = df.loc[df['story_points'] > 0,
+                     ['id', 'title', 'story_points', 'type', 'state', 'assigned_to', 'team']]
+        if len(pos):
+            for rec in pos.nlargest(top_n, 'story_points').to_dict('records'):
+                heapq.heappush(largest_heap, (rec['story_points'], next(tie), rec))
+                if len(largest_heap) > top_n:
+                    heapq.heappop(largest_heap)
+
+        created = df['created_date']
+        if created.count():
+            row = df.loc[created.idxmax()]
+            if newest is None or row['created_date'] > newest['date']:
+                title = row['title']
+                newest = {
+                    'id': row['id'],
+                    'date': row['created_date'],
+                    'title': title[:50] + '...' if len(title) > 50 else title,
+                    'type': row['type'],
+                    'story_points': row['story_points']
+                }
+        open_created = created[open_mask]
+        if open_created.count():
+            row = df.loc[open_created.idxmin()]
+            if oldest_open is None or row['created_date'] < oldest_open['date']:
+                title = row['title']
+                oldest_open = {
+                    'id': row['id'],
+                    'date': row['created_date'],
+                    'title': title[:50] + '...' if len(title) > 50 else title,
+                    'age_days': (datetime.now() - row['created_date']).days,
+                    'priority': row['priority'],
+                    'story_points': row['story_points']
+                }
+
+    analysis['largest_story_items'] = [
+        rec for _, _, rec in sorted(largest_heap, key=lambda e: (e[0], e[1]), reverse=True)
+    ]
+    analysis['newest_item'] = newest
+    analysis['oldest_open_item'] = oldest_open
+    if res_count:
+        analysis['avg_resolution_time'] = res_sum / res_count
+        analysis['max_resolution_time'] = res_max
+        analysis['min_resolution_time'] = res_min
+
+    analysis['priority_sort_keys'] = _priority_sort_keys(analysis['priority_distribution'])
+    print(f"成功解析 {analysis['total_items']} 个工作项")
+    return analysis
+
+def _analyze_rows(work_items):
+    """逐行分析（pandas不可用时的后备路径）"""
     analysis = {
         'total_items': len(work_items),
         'type_distribution': Counter(),
@@ -149,62 +634,63 @@ def analyze_work_items(work_items):
     
     for item in work_items:
         # 基本统计
-        analysis['type_distribution'][item['type']] += 1
-        analysis['state_distribution'][item['state']] += 1
-        analysis['priority_distribution'][item['priority']] += 1
-        analysis['team_distribution'][item['team']] += 1
-        analysis['assignee_distribution'][item['assigned_to']] += 1
+        analysis['type_distribution'][item.type] += 1
+        analysis['state_distribution'][item.state] += 1
+        analysis['priority_distribution'][item.priority] += 1
+        analysis['team_distribution'][item.team] += 1
+        analysis['assignee_distribution'][item.assigned_to] += 1
         
         # Story Points统计
-        story_points = item['story_points']
+        story_points = item.story_points
         analysis['story_points_total'] += story_points
-        analysis['story_points_by_team'][item['team']] += story_points
-        analysis['story_points_by_assignee'][item['assigned_to']] += story_points
-        analysis['story_points_by_type'][item['type']] += story_points
+        analysis['story_points_by_team'][item.team] += story_points
+        analysis['story_points_by_assignee'][item.assigned_to] += story_points
+        analysis['story_points_by_type'][item.type] += story_points
         
         # 按状态分类
-        if item['state'].lower() in ['new', 'active', 'open', 'in progress']:
+        state_lc = item.state_lc
+        if state_lc in OPEN_STATES:
             analysis['open_items'].append(item)
-        elif item['state'].lower() in ['closed', 'resolved', 'done']:
+        elif state_lc in CLOSED_STATES:
             analysis['closed_items'].append(item)
             
             # 收集解决时间数据
-            if item['resolution_days'] is not None:
-                analysis['resolution_times'].append(item['resolution_days'])
+            if item.resolution_days is not None:
+                analysis['resolution_times'].append(item.resolution_days)
         
         # 记录最大的Story Points项
         if story_points > 0:
             analysis['largest_story_items'].append({
-                'id': item['id'],
-                'title': item['title'],
+                'id': item.id,
+                'title': item.title,
                 'story_points': story_points,
-                'type': item['type'],
-                'state': item['state'],
-                'assigned_to': item['assigned_to'],
-                'team': item['team']
+                'type': item.type,
+                'state': item.state,
+                'assigned_to': item.assigned_to,
+                'team': item.team
             })
         
         # 日期相关分析
-        if item['created_date']:
-            if analysis['newest_item'] is None or item['created_date'] > analysis['newest_item']['date']:
+        if item.created_date:
+            if analysis['newest_item'] is None or item.created_date > analysis['newest_item']['date']:
                 analysis['newest_item'] = {
-                    'id': item['id'],
-                    'date': item['created_date'],
-                    'title': item['title'][:50] + '...' if len(item['title']) > 50 else item['title'],
-                    'type': item['type'],
+                    'id': item.id,
+                    'date': item.created_date,
+                    'title': item.title[:50] + '...' if len(item.title) > 50 else item.title,
+                    'type': item.type,
                     'story_points': story_points
                 }
             
             # 如果是开放状态，检查是否为最旧的
-            if item['state'].lower() in ['new', 'active', 'open', 'in progress']:
-                if analysis['oldest_open_item'] is None or item['created_date'] < analysis['oldest_open_item']['date']:
-                    age_days = (datetime.now() - item['created_date']).days
+            if state_lc in OPEN_STATES:
+                if analysis['oldest_open_item'] is None or item.created_date < analysis['oldest_open_item']['date']:
+                    age_days = (datetime.now() - item.created_date).days
                     analysis['oldest_open_item'] = {
-                        'id': item['id'],
-                        'date': item['created_date'],
-                        'title': item['title'][:50] + '...' if len(item['title']) > 50 else item['title'],
+                        'id': item.id,
+                        'date': item.created_date,
+                        'title': item.title[:50] + '...' if len(item.title) > 50 else item.title,
                         'age_days': age_days,
-                        'priority': item['priority'],
+                        'priority': item.priority,
                         'story_points': story_points
                     }
     
@@ -214,9 +700,7 @@ def analyze_work_items(work_items):
         analysis['max_resolution_time'] = max(analysis['resolution_times'])
         analysis['min_resolution_time'] = min(analysis['resolution_times'])
     
-    # 对最大的Story Points项进行排序
-    analysis['largest_story_items'].sort(key=lambda x: x['story_points'], reverse=True)
-    
+    analysis['priority_sort_keys'] = _priority_sort_keys(analysis['priority_distribution'])
     return analysis
 
 def get_story_points_rankings(analysis, top_n=10):
@@ -225,13 +709,15 @@ def get_story_points_rankings(analysis, top_n=10):
         'by_assignee': [],
         'by_team': [],
         'by_type': [],
-        'largest_items': analysis.get('largest_story_items', [])[:top_n]
+        # 只取前top_n：nlargest是O(N log K)，不用整表排序
+        'largest_items': heapq.nlargest(top_n, analysis.get('largest_story_items', []),
+                                        key=operator.itemgetter('story_points'))
     }
-    
+
     # 按指派人排名
     if analysis.get('story_points_by_assignee'):
-        for assignee, points in sorted(analysis['story_points_by_assignee'].items(), 
-                                      key=lambda x: x[1], reverse=True)[:top_n]:
+        for assignee, points in heapq.nlargest(top_n, analysis['story_points_by_assignee'].items(),
+                                               key=operator.itemgetter(1)):
             item_count = analysis['assignee_distribution'][assignee]
             avg_points = points / item_count if item_count > 0 else 0
             rankings['by_assignee'].append({
@@ -243,8 +729,8 @@ def get_story_points_rankings(analysis, top_n=10):
     
     # 按团队排名
     if analysis.get('story_points_by_team'):
-        for team, points in sorted(analysis['story_points_by_team'].items(), 
-                                  key=lambda x: x[1], reverse=True)[:top_n]:
+        for team, points in heapq.nlargest(top_n, analysis['story_points_by_team'].items(),
+                                           key=operator.itemgetter(1)):
             item_count = analysis['team_distribution'][team]
             avg_points = points / item_count if item_count > 0 else 0
             rankings['by_team'].append({
@@ -269,13 +755,21 @@ def get_story_points_rankings(analysis, top_n=10):
     
     return rankings
 
-def generate_report(analysis):
+# 报表行模板：格式串在模块加载时解析进code object，
+# 循环里每行只剩一次format调用
+_ASSIGNEE_ROW = "{:<4} {:<20} {:<10.1f} {:<10} {:<10.2f}"
+_TEAM_ROW = "{:<4} {:<25} {:<10.1f} {:<10} {:<10.2f}"
+_TYPE_ROW = "{:<15} {:<10.1f} {:<10} {:<10.2f}"
+_LARGEST_ROW = "{:<4} {:<10} {:<8.1f} {:<10} {:<12} {:<15} {}"
+
+def generate_report(analysis, rankings=None):
     """生成分析报告"""
     if not analysis or analysis['total_items'] == 0:
         return "没有可分析的数据"
-    
-    # 获取Story Points排名
-    rankings = get_story_points_rankings(analysis)
+
+    # 获取Story Points排名（调用方算好可直接传入，避免重复排序）
+    if rankings is None:
+        rankings = get_story_points_rankings(analysis)
     
     report_lines = []
     report_lines.append("=" * 70)
@@ -301,13 +795,10 @@ def generate_report(analysis):
         report_lines.append(f"{'排名':<4} {'指派人':<20} {'总点数':<10} {'工作项数':<10} {'平均点数':<10}")
         report_lines.append("-" * 60)
         
-        for i, assignee_data in enumerate(rankings['by_assignee'][:10], 1):
-            report_lines.append(
-                f"{i:<4} {assignee_data['name']:<20} "
-                f"{assignee_data['total_points']:<10.1f} "
-                f"{assignee_data['item_count']:<10} "
-                f"{assignee_data['avg_points']:<10.2f}"
-            )
+        report_lines.extend(
+            _ASSIGNEE_ROW.format(i, d['name'], d['total_points'], d['item_count'], d['avg_points'])
+            for i, d in enumerate(rankings['by_assignee'][:10], 1)
+        )
     
     # 按团队排名
     if rankings['by_team']:
@@ -316,13 +807,10 @@ def generate_report(analysis):
         report_lines.append(f"{'排名':<4} {'团队':<25} {'总点数':<10} {'工作项数':<10} {'平均点数':<10}")
         report_lines.append("-" * 60)
         
-        for i, team_data in enumerate(rankings['by_team'][:10], 1):
-            report_lines.append(
-                f"{i:<4} {team_data['name']:<25} "
-                f"{team_data['total_points']:<10.1f} "
-                f"{team_data['item_count']:<10} "
-                f"{team_data['avg_points']:<10.2f}"
-            )
+        report_lines.extend(
+            _TEAM_ROW.format(i, d['name'], d['total_points'], d['item_count'], d['avg_points'])
+            for i, d in enumerate(rankings['by_team'][:10], 1)
+        )
     
     # 按类型排名
     if rankings['by_type']:
@@ -331,13 +819,10 @@ def generate_report(analysis):
         report_lines.append(f"{'类型':<15} {'总点数':<10} {'工作项数':<10} {'平均点数':<10}")
         report_lines.append("-" * 45)
         
-        for type_data in rankings['by_type']:
-            report_lines.append(
-                f"{type_data['name']:<15} "
-                f"{type_data['total_points']:<10.1f} "
-                f"{type_data['item_count']:<10} "
-                f"{type_data['avg_points']:<10.2f}"
-            )
+        report_lines.extend(
+            _TYPE_ROW.format(d['name'], d['total_points'], d['item_count'], d['avg_points'])
+            for d in rankings['by_type']
+        )
     
     # 最大的Story Points项
     if rankings['largest_items']:
@@ -349,12 +834,8 @@ def generate_report(analysis):
         for i, item in enumerate(rankings['largest_items'][:10], 1):
             title_display = item['title'][:30] + '...' if len(item['title']) > 30 else item['title']
             report_lines.append(
-                f"{i:<4} {item['id']:<10} "
-                f"{item['story_points']:<8.1f} "
-                f"{item['type']:<10} "
-                f"{item['state']:<12} "
-                f"{item['assigned_to'][:14]:<15} "
-                f"{title_display}"
+                _LARGEST_ROW.format(i, item['id'], item['story_points'], item['type'],
+                                    item['state'], item['assigned_to'][:14], title_display)
             )
     
     report_lines.append("\n" + "=" * 70)
@@ -381,8 +862,9 @@ def generate_report(analysis):
     # 优先级分布
     report_lines.append("优先级分布:")
     report_lines.append("-" * 35)
-    for priority, count in sorted(analysis['priority_distribution'].items(), 
-                                  key=lambda x: int(x[0]) if x[0].isdigit() else 999):
+    priority_keys = analysis.get('priority_sort_keys') or {}
+    for priority, count in sorted(analysis['priority_distribution'].items(),
+                                  key=lambda x: priority_keys.get(x[0], 999)):
         percentage = (count / analysis['total_items']) * 100
         report_lines.append(f"  Priority {priority:<5} {count:>3} ({percentage:>5.1f}%)")
     report_lines.append("")
@@ -460,69 +942,52 @@ def save_sample_csv(filename="azure_devops_sample.csv"):
         print(f"保存示例文件失败: {e}")
         return None
 
-def export_story_points_analysis(analysis, filename="story_points_analysis.csv"):
+def export_story_points_analysis(analysis, filename="story_points_analysis.csv", rankings=None):
     """导出Story Points分析报告"""
     if not analysis or analysis['total_items'] == 0:
         print("没有数据可导出")
         return False
-    
+
     try:
-        rankings = get_story_points_rankings(analysis)
+        if rankings is None:
+            rankings = get_story_points_rankings(analysis)
         
-        with open(filename, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.writer(file)
-            
-            # 写入标题
-            writer.writerow(["Story Points 详细分析报告"])
-            writer.writerow([])
-            
-            # 汇总信息
-            writer.writerow(["汇总信息"])
-            writer.writerow(["总工作项数", analysis['total_items']])
-            writer.writerow(["总Story Points", f"{analysis['story_points_total']:.2f}"])
-            writer.writerow(["平均Story Points", f"{analysis['story_points_total']/analysis['total_items']:.2f}"])
-            writer.writerow([])
-            
-            # 按指派人排名
-            writer.writerow(["按指派人Story Points排名"])
-            writer.writerow(["排名", "指派人", "总点数", "工作项数", "平均点数"])
-            for i, assignee_data in enumerate(rankings['by_assignee'], 1):
-                writer.writerow([
-                    i,
-                    assignee_data['name'],
-                    f"{assignee_data['total_points']:.2f}",
-                    assignee_data['item_count'],
-                    f"{assignee_data['avg_points']:.2f}"
-                ])
-            writer.writerow([])
-            
-            # 按团队排名
-            writer.writerow(["按团队Story Points排名"])
-            writer.writerow(["排名", "团队", "总点数", "工作项数", "平均点数"])
-            for i, team_data in enumerate(rankings['by_team'], 1):
-                writer.writerow([
-                    i,
-                    team_data['name'],
-                    f"{team_data['total_points']:.2f}",
-                    team_data['item_count'],
-                    f"{team_data['avg_points']:.2f}"
-                ])
-            writer.writerow([])
-            
-            # 最大的Story Points项
-            writer.writerow(["最大的Story Points工作项"])
-            writer.writerow(["排名", "ID", "点数", "类型", "状态", "指派人", "团队", "标题"])
-            for i, item in enumerate(rankings['largest_items'][:20], 1):
-                writer.writerow([
-                    i,
-                    item['id'],
-                    f"{item['story_points']:.1f}",
-                    item['type'],
-                    item['state'],
-                    item['assigned_to'],
-                    item['team'],
-                    item['title']
-                ])
+        # 整个报表先拼成行列表，最后一次writerows落盘，
+        # 省掉上百次跨csv模块的单行调用
+        rows = [
+            ["Story Points 详细分析报告"],
+            [],
+            ["汇总信息"],
+            ["总工作项数", analysis['total_items']],
+            ["总Story Points", f"{analysis['story_points_total']:.2f}"],
+            ["平均Story Points", f"{analysis['story_points_total']/analysis['total_items']:.2f}"],
+            [],
+            ["按指派人Story Points排名"],
+            ["排名", "指派人", "总点数", "工作项数", "平均点数"],
+        ]
+        rows.extend(
+            [i, d['name'], f"{d['total_points']:.2f}", d['item_count'], f"{d['avg_points']:.2f}"]
+            for i, d in enumerate(rankings['by_assignee'], 1))
+        rows.extend([
+            [],
+            ["按团队Story Points排名"],
+            ["排名", "团队", "总点数", "工作项数", "平均点数"],
+        ])
+        rows.extend(
+            [i, d['name'], f"{d['total_points']:.2f}", d['item_count'], f"{d['avg_points']:.2f}"]
+            for i, d in enumerate(rankings['by_team'], 1))
+        rows.extend([
+            [],
+            ["最大的Story Points工作项"],
+            ["排名", "ID", "点数", "类型", "状态", "指派人", "团队", "标题"],
+        ])
+        rows.extend(
+            [i, item['id'], f"{item['story_points']:.1f}", item['type'], item['state'],
+             item['assigned_to'], item['team'], item['title']]
+            for i, item in enumerate(rankings['largest_items'][:20], 1))
+
+        with open(filename, 'w', encoding='utf-8', newline='', buffering=1 << 20) as file:
+            csv.writer(file).writerows(rows)
         
         print(f"Story Points分析报告已导出到: {filename}")
         return True
@@ -573,26 +1038,43 @@ def main():
     print(f"开始分析文件: {args.csv_file}")
     print("-" * 50)
     
-    # 解析CSV文件
-    work_items = parse_csv_file(args.csv_file)
-    
-    if not work_items:
+    try:
+        file_size = os.path.getsize(args.csv_file)
+    except OSError:
+        file_size = 0
+
+    if _HAS_PANDAS and file_size > _STREAM_SIZE_THRESHOLD:
+        # 大文件走流式分块分析，内存不随行数增长
+        print("文件较大，使用流式分块分析...")
+        analysis = analyze_csv_streaming(args.csv_file)
+    else:
+        # 解析CSV文件
+        work_items = parse_csv_file(args.csv_file)
+
+        if work_items is None or len(work_items) == 0:
+            print("没有解析到有效的工作项数据")
+            return
+
+        # 分析数据
+        print("正在分析数据...")
+        analysis = analyze_work_items(work_items)
+
+    if not analysis or analysis['total_items'] == 0:
         print("没有解析到有效的工作项数据")
         return
     
-    # 分析数据
-    print("正在分析数据...")
-    analysis = analyze_work_items(work_items)
-    
+    # 排名只算一次，报告和导出共用
+    rankings = get_story_points_rankings(analysis)
+
     # 生成报告
-    report = generate_report(analysis)
-    
+    report = generate_report(analysis, rankings=rankings)
+
     # 输出报告
     print("\n" + report)
-    
+
     # 导出Story Points分析报告
     if args.story_points_report:
-        export_story_points_analysis(analysis, args.story_points_report)
+        export_story_points_analysis(analysis, args.story_points_report, rankings=rankings)
     
     # 提供基于Story Points的建议
     print("\n📋 基于Story Points的分析建议:")
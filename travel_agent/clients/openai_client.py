@@ -1,12 +1,34 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+import httpx
+
+# http2需要可选的h2包；模块导入时就建客户端，
+# 缺h2必须降级到HTTP/1.1而不是让import直接失败
+try:
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+# 共享的HTTP连接池：HTTP/2多路复用 + keep-alive，
+# 重复调用不再每次做TCP/TLS握手
+_HTTPX_CLIENT = httpx.Client(
+    http2=_HAS_H2,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+)
+_ASYNC_HTTPX_CLIENT = httpx.AsyncClient(
+    http2=_HAS_H2,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+)
 
 
 class OpenaiClientWrapper:
     def __init__(self,api_key:str,base_url:str,model_id:str):
-        self.client = OpenAI(api_key=api_key,base_url=base_url)
+        self.client = OpenAI(api_key=api_key,base_url=base_url,http_client=_HTTPX_CLIENT)
+        self.async_client = AsyncOpenAI(api_key=api_key,base_url=base_url,http_client=_ASYNC_HTTPX_CLIENT)
         self.model =model_id
-        
-    def generate(self, prompt: str, system_prompt: str) -> str:
+
+    def generate(self, prompt: str, system_prompt: str,
+                 temperature: float = 0.7, max_tokens: int = 1000) -> str:
 
         print("calling LLM...")
         try:
@@ -14,15 +36,41 @@ class OpenaiClientWrapper:
                 {'role': 'system', 'content': system_prompt},
                 {'role': 'user', 'content': prompt}
             ]
-            response = self.client.chat.completions.create(
+            # stream=True：边生成边收token，首token远早于完整回复到达
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
-                stream=False
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
             )
-            answer = response.choices[0].message.content
+            parts = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+            answer = "".join(parts)
             print("LLM Responsed")
             return answer
         except Exception as e:
             print(f"Error when calling LLM API: {e}")
             return "Error when calling LLM API"
-        
\ No newline at end of file
+
+    async def generate_async(self, prompt: str, system_prompt: str,
+                             temperature: float = 0.7, max_tokens: int = 1000) -> str:
+        """异步版本：多个请求可以在网络延迟上重叠"""
+        try:
+            messages = [
+                {'role': 'system', 'content': system_prompt},
+                {'role': 'user', 'content': prompt}
+            ]
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=False
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            print(f"Error when calling LLM API: {e}")
+            return "Error when calling LLM API"
@@ -1,22 +1,44 @@
 from tavily import TavilyClient
+import asyncio
 import logging
 
+from utils.helpers import gather_with_concurrency
+
 
 logger = logging.getLogger(__name__)
 
-class TabilyClientWrapper:
+class TavilyClientWrapper:
     def __init__(self,api_key:str):
         self.client= TavilyClient(api_key=api_key)
-    
+        # 相同查询直接复用结果，省掉整个网络往返
+        self._cache = {}
+
     def search(self,
         query: str,
         search_depth: str = "basic",
         include_answer: bool = True):
+        key = (query, search_depth, include_answer)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            self.client.search(query=query,search_depth=search_depth,include_answer=include_answer)
+            result = self.client.search(query=query,search_depth=search_depth,include_answer=include_answer)
         except Exception as e:
-            logger.error(f"Tavily search failed: {e}")
+            logger.error("Tavily search failed: %s", e)
             return {"error": str(e)}
-           
-        
-    
\ No newline at end of file
+
+        self._cache[key] = result
+        return result
+
+    async def search_async(self,
+        query: str,
+        search_depth: str = "basic",
+        include_answer: bool = True):
+        """异步搜索：同步客户端丢到线程池，不阻塞事件循环"""
+        return await asyncio.to_thread(self.search, query, search_depth, include_answer)
+
+    async def batch_search(self, queries, concurrency: int = 5):
+        """批量搜索：多个查询在网络延迟上重叠，并发数有上限"""
+        return await gather_with_concurrency(
+            concurrency, *(self.search_async(q) for q in queries))
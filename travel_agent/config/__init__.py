@@ -1,5 +1,6 @@
 
 from dataclasses import dataclass
+import functools
 import os
 from typing import Optional
 
@@ -9,7 +10,9 @@ class OpenAiConfig:
     base_url: str
     model_id:str
     
+    # 环境变量进程内不变：首次读取后缓存，后续调用不再碰os.environ
     @classmethod
+    @functools.cache
     def from_env(cls)->Optional[OpenAiConfig]:
         api_key=os.getenv("API_KEY")
         base_url=os.getenv("BASE_URL")
@@ -27,6 +30,7 @@ class TavilyApiConfig:
     api_key:str=""
     
     @classmethod
+    @functools.cache
     def from_env(cls)->Optional[TavilyApiConfig]:
         api_key=os.getenv("TAVILY_API_KEY")
         if not api_key:
@@ -43,6 +47,7 @@ class AgentConfig:
     max_tokens: int = 1000
     
     @classmethod
+    @functools.cache
     def from_env(cls) -> 'AgentConfig':
         return cls(
             max_iterations=int(os.getenv("MAX_ITERATIONS", "5")),
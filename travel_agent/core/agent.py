@@ -1,3 +1,6 @@
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Callable
 from config.prompt import AGENT_SYSTEM_PROMPT
 from core.parser import ResponseParser
@@ -5,6 +8,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 分隔线在模块加载时构造一次，循环里直接引用
+_SEP = "=" * 40
+
+# 驻留热路径字符串：与解析器返回的驻留键做指针比较
+_FINISH = sys.intern("finish")
+_ANSWER = sys.intern("answer")
+_OBS = "Observation: "
+
 class TravelAgent:
     
     def __init__(self, llm_client, tools: Dict[str, Callable], config):
@@ -13,24 +24,34 @@ class TravelAgent:
         self.config = config
         self.conversation_history: List[str] = []
         self.parser = ResponseParser()
-        
+        # 提示词用StringIO只追加缓冲维护：写入是O(片段长度)，
+        # 不会像字符串拼接那样每次复制整个前缀
+        self._prompt_buf = io.StringIO()
+
     def add_to_history(self, content: str):
         self.conversation_history.append(content)
-    
+        if self._prompt_buf.tell():
+            self._prompt_buf.write("\n")
+        self._prompt_buf.write(content)
+
     def get_full_prompt(self) -> str:
-        return "\n".join(self.conversation_history)
+        return self._prompt_buf.getvalue()
     
     def run(self, user_input: str) -> str:
-        logger.info(f"user input: {user_input}")
+        logger.info("user input: %s", user_input)
         
         self.conversation_history = [f"user input: {user_input}"]
-        
-        print(f"user input: {user_input}\n" + "="*40)
+        self._prompt_buf = io.StringIO(self.conversation_history[0])
+        self._prompt_buf.seek(0, io.SEEK_END)
+
+        print(f"user input: {user_input}\n" + _SEP)
         
         for iteration in range(self.config.max_iterations):
-            logger.info(f"iterator {iteration + 1}")
-            print(f"\n--- cycling {iteration + 1} ---")
-            
+            logger.info("iterator %d", iteration + 1)
+            # 本轮输出先攒进列表，迭代末尾一次write落到stdout，
+            # 不再每条print各拿一次锁、各刷一次缓冲
+            out = [f"\n--- cycling {iteration + 1} ---"]
+
             full_prompt = self.get_full_prompt()
             llm_output = self.llm_client.generate(
                 prompt=full_prompt,
@@ -38,39 +59,85 @@ class TravelAgent:
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens
             )
-            
+
+            # 模型一次规划了多个相互独立的工具调用（如天气+景点）时，
+            # 不截断，改为并发执行，网络延迟相互重叠
+            if self._run_independent_actions(llm_output, out):
+                self._flush_output(out)
+                continue
+
             llm_output = self.parser.truncate_multiple_actions(llm_output)
-            print(f"model output:\n{llm_output}\n")
+            out.append(f"model output:\n{llm_output}\n")
             self.add_to_history(llm_output)
-            
+
             thought, action_str = self.parser.parse_llm_output(llm_output)
-            
+
             if not action_str:
                 logger.error("Can Not Find Valid Action")
-                print("No Action was found!")
+                out.append("No Action was found!")
+                self._flush_output(out)
                 break
-            
-            if action_str.startswith("finish"):
-                _, kwargs = self.parser.parse_action(action_str)
-                final_answer = kwargs.get("answer", "Task Finished")
-                print(f"Task finished, here is the answer {final_answer}")
-                return final_answer
-            
+
+            # 只解析一次，finish与工具调用共用同一个解析结果
             tool_name, kwargs = self.parser.parse_action(action_str)
-            
+
+            if tool_name == _FINISH:
+                final_answer = kwargs.get(_ANSWER, "Task Finished")
+                out.append(f"Task finished, here is the answer {final_answer}")
+                self._flush_output(out)
+                return final_answer
+
             if tool_name in self.tools:
-                logger.info(f"execute tool: {tool_name}, parameters: {kwargs}")
+                logger.info("execute tool: %s, parameters: %s", tool_name, kwargs)
                 observation = self.tools[tool_name](**kwargs)
             else:
                 observation = f"Error: tool undefined '{tool_name}'"
                 logger.error(observation)
-            
-            observation_str = f"Observation: {observation}"
-            print(f"{observation_str}\n" + "="*40)
+
+            observation_str = _OBS + str(observation)
+            out.append(f"{observation_str}\n" + _SEP)
             self.add_to_history(observation_str)
-        
+            self._flush_output(out)
+
         return "Error:Reach Max Iteration Times, Task not finished!"
+
+    @staticmethod
+    def _flush_output(lines: List[str]):
+        """整轮输出拼成一个字符串，一次系统调用写出"""
+        sys.stdout.write("\n".join(lines) + "\n")
     
+    def _run_independent_actions(self, llm_output: str, out: List[str]) -> bool:
+        """输出里有多个已知工具的调用时并发执行，返回是否已处理。
+
+        含finish或无法解析的动作串不走并发路径，交回串行逻辑。
+        """
+        # 模型编造了Observation:时也交回串行路径：那边会先截断，
+        # 不能把伪造的观察原样写进历史
+        if "Observation:" in llm_output:
+            return False
+        actions = self.parser.parse_all_actions(llm_output)
+        if len(actions) < 2:
+            return False
+        try:
+            parsed = [self.parser.parse_action(a) for a in actions]
+        except ValueError:
+            return False
+        if not all(name in self.tools for name, _ in parsed):
+            return False
+
+        out.append(f"model output:\n{llm_output}\n")
+        self.add_to_history(llm_output)
+        logger.info("execute %d tools concurrently", len(parsed))
+        with ThreadPoolExecutor(max_workers=len(parsed)) as pool:
+            futures = [pool.submit(self.tools[name], **kwargs) for name, kwargs in parsed]
+            # 按规划顺序收集结果，观察与动作一一对应
+            for future in futures:
+                observation_str = _OBS + str(future.result())
+                out.append(f"{observation_str}\n" + _SEP)
+                self.add_to_history(observation_str)
+        return True
+
     def reset(self):
         """Reset history"""
-        self.conversation_history = []
\ No newline at end of file
+        self.conversation_history = []
+        self._prompt_buf = io.StringIO()
\ No newline at end of file
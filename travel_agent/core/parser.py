@@ -1,49 +1,119 @@
 
+import functools
 import re
+import sys
 from typing import Tuple, Optional, Dict
 
+# 模块加载时编译一次，免去每轮对话里重复的正则编译/缓存查找
+_THOUGHT_RE = re.compile(r"Thought:\s*(.*?)(?=\s*Action:|\s*$)", re.DOTALL)
+_ACTION_RE = re.compile(r"Action:\s*(.*?)(?=\s*Thought:|\s*$)", re.DOTALL)
+# 常见的"Thought在前、Action在后"布局一次匹配拿到两段，
+# 只在不符合该布局时才退回两次独立search
+_TA_RE = re.compile(
+    r"Thought:\s*(?P<thought>.*?)\s*Action:\s*(?P<action>.*?)(?=\s*Thought:|\s*$)",
+    re.DOTALL
+)
+_CALL_RE = re.compile(r"(\w+)\((.*)\)")
+# 拆分用的变体：前瞻也停在下一个Action:，
+# 连续的"Action: a(...)\nAction: b(...)"才能拆成两条
+_ACTION_SPLIT_RE = re.compile(
+    r"Action:\s*(.*?)(?=\s*Thought:|\s*Action:|\s*$)", re.DOTALL)
+
+# 驻留高频字符串：字典查找先走指针相等的快路径
+_FINISH = sys.intern("finish")
+_ANSWER = sys.intern("answer")
+_TRUNC_RE = re.compile(
+    r'(Thought:.*?Action:.*?)(?=\n\s*(?:Thought:|Action:|Observation:)|\Z)',
+    re.DOTALL
+)
+
+def _scan_kwargs(args_str: str) -> Tuple[Tuple[str, str], ...]:
+    """手写单遍扫描：用str.find定位 =\"...\" 边界直接切片。
+
+    动作参数串又短又规整，绕过正则引擎比findall省掉
+    匹配对象和中间分组的开销。
+    """
+    pairs = []
+    pos = 0
+    find = args_str.find
+    while True:
+        eq = find('="', pos)
+        if eq == -1:
+            break
+        end = find('"', eq + 2)
+        if end == -1:
+            break
+        # 参数名是=号前面连续的标识符字符
+        start = eq
+        while start > 0 and (args_str[start - 1].isalnum() or args_str[start - 1] == '_'):
+            start -= 1
+        if start < eq:
+            pairs.append((sys.intern(args_str[start:eq]), args_str[eq + 2:end]))
+        pos = end + 1
+    return tuple(pairs)
+
+# 模型重试/循环时经常产出一模一样的动作串，解析结果直接复用
+@functools.lru_cache(maxsize=256)
+def _parse_action_cached(action_str: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    if action_str.startswith("finish("):
+        # finish结构固定：纯切片取answer值，不进正则引擎
+        inner = action_str[7:-1]
+        if (inner.startswith('answer="') and inner.endswith('"')
+                and inner.count('"') == 2):
+            return _FINISH, ((_ANSWER, inner[8:-1]),)
+        return _FINISH, _scan_kwargs(inner)
+
+    match = _CALL_RE.match(action_str)
+    if not match:
+        # 模型偶尔输出不带括号的"finish"：当成无参结束，别让整轮对话崩掉
+        if action_str.startswith("finish"):
+            return _FINISH, ()
+        raise ValueError(f"invalid action format: {action_str}")
+
+    tool_name = sys.intern(match.group(1))
+    args_str = match.group(2)
+
+    args = _scan_kwargs(args_str) if args_str else ()
+    return tool_name, args
+
 class ResponseParser:
-    
+
     @staticmethod
     def parse_llm_output(llm_output: str) -> Tuple[Optional[str], Optional[str]]:
 
-        thought_match = re.search(r"Thought:\s*(.*?)(?=\s*Action:|\s*$)", llm_output, re.DOTALL)
-        action_match = re.search(r"Action:\s*(.*?)(?=\s*Thought:|\s*$)", llm_output, re.DOTALL)
-        
+        combined = _TA_RE.search(llm_output)
+        if combined:
+            return combined.group("thought").strip(), combined.group("action").strip()
+
+        thought_match = _THOUGHT_RE.search(llm_output)
+        action_match = _ACTION_RE.search(llm_output)
+
         thought = thought_match.group(1).strip() if thought_match else None
         action = action_match.group(1).strip() if action_match else None
-        
+
         return thought, action
     
     @staticmethod
     def parse_action(action_str: str) -> Tuple[str, Dict[str, str]]:
-
-        if action_str.startswith("finish"):
-            return "finish", {"answer": action_str[7:-1]}
-        
-        match = re.match(r"(\w+)\((.*)\)", action_str)
-        if not match:
-            raise ValueError(f"invalid action format: {action_str}")
-        
-        tool_name = match.group(1)
-        args_str = match.group(2)
-        
-       
-        kwargs = {}
-        if args_str:
-            args = re.findall(r'(\w+)="([^"]*)"', args_str)
-            for key, value in args:
-                kwargs[key] = value
-        
-        return tool_name, kwargs
+        # 缓存返回元组（不可变，可安全共享）；字典在调用处新建，
+        # 避免调用方改动缓存条目
+        tool_name, args = _parse_action_cached(action_str)
+        return tool_name, dict(args)
     
+    @staticmethod
+    def parse_all_actions(llm_output: str):
+        """按出现顺序提取输出里的全部Action串"""
+        return [m.group(1).strip() for m in _ACTION_SPLIT_RE.finditer(llm_output)]
+
     @staticmethod
     def truncate_multiple_actions(llm_output: str) -> str:
-        match = re.search(
-            r'(Thought:.*?Action:.*?)(?=\n\s*(?:Thought:|Action:|Observation:)|\Z)',
-            llm_output,
-            re.DOTALL
-        )
+        # 绝大多数输出只有一组Thought/Action且没有编造的Observation：
+        # 几次C级扫描就能断定无需截断，跳过回溯型正则
+        if (llm_output.count("Action:") <= 1 and llm_output.count("Thought:") <= 1
+                and "Observation:" not in llm_output):
+            return llm_output
+
+        match = _TRUNC_RE.search(llm_output)
         if match:
             truncated = match.group(1).strip()
             if truncated != llm_output.strip():
@@ -2,14 +2,17 @@
 主程序入口
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from config import ConfigManager
 from clients.openai_client import OpenaiClientWrapper
-from clients.tavily_client import TabilyClientWrapper
+from clients.tavily_client import TavilyClientWrapper
 from tools.weather_tool import WeatherTool
 from tools.attraction_tool import AttractionTool
 from core.agent import TravelAgent
 from utils.helpers import setup_logging, validate_environment
 
+_BANNER = "=" * 50
+
 def main():
     # set up logging
     setup_logging()
@@ -25,8 +28,12 @@ def main():
     
     try:
         # initialize client
-        openai_client = OpenaiClientWrapper(config_manager.openai)
-        tavily_client = TabilyClientWrapper(config_manager.tavily.api_key)
+        # 两个客户端的构造互不依赖（各自建连接池/读配置），并行初始化
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            openai_future = pool.submit(OpenaiClientWrapper, config_manager.openai)
+            tavily_future = pool.submit(TavilyClientWrapper, config_manager.tavily.api_key)
+            openai_client = openai_future.result()
+            tavily_client = tavily_future.result()
         
         # initialize tools 
         weather_tool = WeatherTool()
@@ -45,7 +52,7 @@ def main():
         )
         
         print("🤖 旅行智能体已启动 (输入 'quit' 退出)")
-        print("=" * 50)
+        print(_BANNER)
         
         while True:
             try:
@@ -1,27 +1,22 @@
 from base import BaseTool
-from clients.tavily_client import TabilyClientWrapper
+from clients.tavily_client import TavilyClientWrapper
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class AttractionTool(BaseTool):
-    
+
+    name = "get_attraction"
+    description = "attractions according to weather and city"
+
     def __init__(self,api_key:str):
-        self.client = TabilyClientWrapper(api_key=api_key)
-    
-    @property
-    def name()->str:
-        return "get_attraction"
-    
-    @property
-    def description()->str:
-        return "attractions according to weather and city"
-    
+        self.client = TavilyClientWrapper(api_key=api_key)
+
     def execute(self, city:str,weather:str)->str:
         
         
-        logger.info(f"search city: {city}, weather: {weather}")
+        logger.info("search city: %s, weather: %s", city, weather)
         
         query = f"Top tourist attractions to visit in {city} during {weather} weather"
         
@@ -34,18 +29,18 @@ class AttractionTool(BaseTool):
             if response.get("answer"):
                     return response["answer"]
                 
-            formatted_results = []
-            for result in response.get("results", []):
-                    formatted_results.append(
-                        f"📌 {result.get('title', 'no title')}\n"
-                        f"   {result.get('content', 'no content')}\n"
-                        f"   🔗 {result.get('url', 'no link')}\n"
-                    )
-                
-            if not formatted_results:
+            results = response.get("results", [])
+            if not results:
                     return f"Sorry, can not find tourist attractions {city} during {weather}"
-                
-            return "Based on the search results, here are the recommended attractions:\n\n" + "\n".join(formatted_results)
+
+            # 生成器直接喂给join，一次拼出整段文本，不留中间列表
+            formatted = "\n".join(
+                f"📌 {r.get('title', 'no title')}\n"
+                f"   {r.get('content', 'no content')}\n"
+                f"   🔗 {r.get('url', 'no link')}\n"
+                for r in results
+            )
+            return "Based on the search results, here are the recommended attractions:\n\n" + formatted
                 
         except Exception as e:
                 error_msg = f"tool executed with error: {e}"
@@ -1,27 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from functools import cached_property
+from typing import Any, ClassVar, Dict
 import inspect
 
 
 class BaseTool(ABC):
-    
-    
-    @property
-    @abstractmethod
-    def name(self)->str:
-        pass
-    
-    @property
-    @abstractmethod
-    def descrption(self)->str:
-        pass
-    
-    
+
+    # name/description是固定元数据，声明为类属性：
+    # 热路径上的取值是一次普通属性查找，不走property描述符
+    name: ClassVar[str]
+    description: ClassVar[str]
+
     @abstractmethod
     def execute(self,**kwargs)-> str:
         pass
     
-    @property
+    # inspect.signature每次都重新反射execute；签名不会变，算一次存实例上
+    @cached_property
     def signature(self)->str:
         sig = inspect.signature(self.execute)
         params=[]
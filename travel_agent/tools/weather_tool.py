@@ -1,31 +1,57 @@
 import json
+import time
 from tools.base import BaseTool
 import logging
 import httpx
 
+# wttr.in返回好几KB的JSON而我们只取4个字段：
+# 有orjson（C实现）就用它解码，没有退回标准库
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# http2需要可选的h2包；缺了就降级到HTTP/1.1，不在构造时抛ImportError
+try:
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
 logger = logging.getLogger(__name__)
 
 class WeatherTool(BaseTool):
-    
-    @property
-    def name()->str:
-        return "get_weather"
-    
-    
-    @property
-    def description()->str:
-        return "get weather of certain city"
-    
+
+    name = "get_weather"
+    description = "get weather of certain city"
+
+    def __init__(self):
+        # 复用同一个Client：连接/TLS握手只做一次，后续查询走keep-alive
+        self._client = httpx.Client(timeout=10.0, http2=_HAS_H2)
+        # 天气短时间内不会变：按城市缓存5分钟，命中时零网络请求
+        self._cache: dict = {}
+        self._ttl = 300.0
+
+    def close(self):
+        self._client.close()
 
     def execute(self, city: str) -> str:
-        logger.info(f"search weather: {city}")
-        
+        logger.info("search weather: %s", city)
+
+        cache_key = city.strip().lower()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            report, fetched_at = cached
+            if time.monotonic() - fetched_at < self._ttl:
+                return report
+
         url = f"https://wttr.in/{city}?format=j1"
-        
+
         try:
-            response = httpx.get(url, timeout=10.0)
+            response = self._client.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             
             current_condition = data['current_condition'][0]
             weather_desc = current_condition['weatherDesc'][0]['value']
@@ -33,18 +59,21 @@ class WeatherTool(BaseTool):
             feels_like = current_condition['FeelsLikeC']
             humidity = current_condition['humidity']
             
-            return (
+            report = (
                 f"{city} current weather: {weather_desc}\n"
                 f"🌡️ temperature: {temp_c}°C (feels{feels_like}°C)\n"
                 f"💧 Humidity: {humidity}%\n"
                 f"🌬️ Condition: {current_condition.get('windspeedKmph', 'N/A')} km/h"
             )
+            self._cache[cache_key] = (report, time.monotonic())
+            return report
             
-        except httpx.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_msg = f"network error: {e}"
             logger.error(error_msg)
             return error_msg
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
+        # ValueError同时覆盖json.JSONDecodeError和orjson.JSONDecodeError
+        except (KeyError, IndexError, ValueError) as e:
             error_msg = f"data analysis error: {e}"
             logger.error(error_msg)
             return error_msg
@@ -1,6 +1,17 @@
 
+import asyncio
 import logging
 
+async def gather_with_concurrency(limit, *coros):
+    """并发执行协程，但限制同时在飞的数量"""
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros))
+
 def setup_logging(level=logging.INFO):
     logging.basicConfig(
         level=level,
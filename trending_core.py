@@ -0,0 +1,672 @@
+"""GitHub Trending爬虫核心模块：worm.py等入口脚本共用的实现"""
+
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import List, Optional, Tuple
+from bs4 import BeautifulSoup
+import httpx
+
+# 解析是每种语言最大的CPU开销：装了lxml就用C解析器（快5-10倍），
+# 没装退回纯Python的html.parser，find/find_all接口完全一致
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
+# 次快一档：lxml直连。预编译的XPath在C层一次性走完整棵树，
+# 省掉bs4每次find/find_all的Python级遍历
+try:
+    from lxml import html as lxml_html
+    from lxml.etree import XPath
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+if _HAS_LXML:
+    _X_ARTICLES = XPath("//article[contains(@class,'Box-row')]")
+    _X_TITLE_LINK = XPath(".//h2[contains(@class,'h3')]//a")
+    _X_DESC = XPath(".//p[contains(@class,'col-9')]")
+    _X_LANG = XPath(".//span[@itemprop='programmingLanguage']")
+    _X_MUTED = XPath(".//a[contains(@class,'Link--muted')]")
+
+# 更快一档：selectolax的Lexbor后端整个解析都在C里，
+# CSS选择器直接查C树，没有bs4那层Python节点包装
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+
+# JSON落盘：orjson直接产出UTF-8字节且默认不转义非ASCII，
+# 比json.dump快一个量级；没装就用标准库
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# top-N用numpy的argpartition（O(n)选择）；没装numpy退回sorted
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# http2需要可选的h2包；缺了就降级到HTTP/1.1，不在建客户端时抛ImportError
+try:
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+# slots=True：每个仓库对象省掉__dict__，属性读取也更快
+@dataclass(slots=True)
+class GitHubRepo:
+    name: str
+    url: str
+    description: Optional[str]
+    stars: int
+    forks: int
+    language: Optional[str]
+    today_stars: Optional[int] = None
+
+    def is_popular(self) -> bool:
+        """判断仓库是否受欢迎"""
+        match self:
+            case GitHubRepo(stars=s) if s > 10000:
+                return True
+            case GitHubRepo(today_stars=ts) if ts and ts > 500:
+                return True
+            case _:
+                return False
+
+class SortBy(Enum):
+    """排序方式枚举"""
+    STARS = "stars"
+    FORKS = "forks"
+    TODAY = "today"
+
+def sort_repos(repos: List[GitHubRepo], by: SortBy = SortBy.STARS) -> List[GitHubRepo]:
+    """排序仓库列表"""
+    match by:
+        case SortBy.STARS:
+            return sorted(repos, key=lambda x: x.stars, reverse=True)
+        case SortBy.FORKS:
+            return sorted(repos, key=lambda x: x.forks, reverse=True)
+        case SortBy.TODAY:
+            # 过滤出有今日星标数据的仓库
+            filtered = [r for r in repos if r.today_stars is not None]
+            return sorted(filtered, key=lambda x: x.today_stars or 0, reverse=True)
+        case _:
+            return repos
+
+# 导出时按这组字段名批量getattr，不用手写七个键
+_REPO_FIELDS = ("name", "url", "description", "stars", "forks", "language", "today_stars")
+
+def _make_client() -> httpx.AsyncClient:
+    """构造共享的AsyncClient：一个连接池可被所有语言复用"""
+    # http2：六个语言请求可以在同一条TCP/TLS连接上多路复用；
+    # 显式声明压缩：trending页面br压缩后只有原来的约1/5，httpx自动解码
+    return httpx.AsyncClient(
+        timeout = 30.0,
+        http2 = _HAS_H2,
+        limits = httpx.Limits(max_connections=10),
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "application/vnd.github.v3+json",
+            "Accept-Encoding": "gzip, deflate, br"
+        },
+        follow_redirects=True
+    )
+
+# 抓到的HTML落盘缓存目录
+_CACHE_DIR = ".cache"
+
+class GitHubTrendingScraper:
+    BASE_URL = "https://github.com/trending"
+
+    def __init__(self, language: str = "", since: str = "daily",
+                 session: Optional[httpx.AsyncClient] = None):
+        self.language = language
+        self.since = since
+        self.session: Optional[httpx.AsyncClient] = session
+        # 外部传入的客户端由调用方负责关闭
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = _make_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session and self._owns_session:
+            await self.session.aclose()
+    
+    def _build_url(self) -> str:
+        url = self.BASE_URL
+        if self.language:
+            url += f"/{self.language}"
+        url += f"?since={self.since}"
+        return url
+    
+    def _cache_path(self) -> str:
+        # 按(语言, 时间范围, 小时)分键：一小时内的重复抓取直接读盘
+        key = f"{self.language or 'all'}_{self.since}_{datetime.now():%Y%m%d%H}.html"
+        return os.path.join(_CACHE_DIR, key)
+
+    async def fetch_page(self) -> str:
+        if not self.session:
+            raise RuntimeError("Session not initialized. Use 'async with' context manager.")
+
+        cache_path = self._cache_path()
+        try:
+            if time.time() - os.path.getmtime(cache_path) < 3600:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    return f.read()
+        except OSError:
+            pass  # 没有缓存文件，正常抓取
+
+        url = self._build_url()
+        try:
+            response = await self.session.get(url)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"GET {self.language or 'all'} FAILED: {e}")
+            return ""
+
+        html = response.text
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                f.write(html)
+        except OSError:
+            pass  # 缓存写不进去不影响主流程
+        return html
+    
+    async def scrape(self) -> List[GitHubRepo]:
+        """MAIN SCRAPE Method"""
+        html = await self.fetch_page()
+        if not html:
+            return []
+
+        # 解析丢进进程池：HTML分词持有GIL，放在事件循环线程里
+        # 会把六个语言的解析串行化
+        global _POOL_BROKEN
+        if _POOL_BROKEN:
+            return _parse_html(html)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(_get_parse_pool(), _parse_html, html)
+        except (OSError, PermissionError, BrokenExecutor):
+            # 起不了子进程的受限环境、或池挂掉（BrokenProcessPool）时
+            # 就地解析；记住失败，后面的语言别再往坏掉的池里提交
+            _POOL_BROKEN = True
+            return _parse_html(html)
+
+# 进程池按需创建：纯导入本模块（比如在子进程里）不该孵化进程
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+# 一旦池证明不可用就锁存，scrape直接走就地解析
+_POOL_BROKEN = False
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=min(6, os.cpu_count() or 1))
+    return _PARSE_POOL
+
+def _parse_html(html: str) -> List[GitHubRepo]:
+    """纯函数入口：顶层定义保证可pickle，按最快的可用后端解析。
+
+    优先级：selectolax > lxml XPath > bs4。
+    """
+    if _HAS_SELECTOLAX:
+        return _parse_repos_selectolax(html)
+    if _HAS_LXML:
+        return _parse_repos_lxml(html)
+    return _parse_repos_bs4(html)
+
+class GitHubAPIScraper:
+    """走GitHub搜索API的替代实现：紧凑JSON代替HTML，完全不经过解析器。
+
+    与GitHubTrendingScraper的scrape()签名一致，可直接互换；
+    today_stars API不提供，需要时仍用HTML版补齐。
+    """
+    BASE_URL = "https://api.github.com/search/repositories"
+
+    # since映射成搜索窗口的天数
+    _SINCE_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+    def __init__(self, language: str = "", since: str = "daily",
+                 session: Optional[httpx.AsyncClient] = None):
+        self.language = language
+        self.since = since
+        self.session: Optional[httpx.AsyncClient] = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = _make_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session and self._owns_session:
+            await self.session.aclose()
+
+    def _build_params(self) -> dict:
+        days = self._SINCE_DAYS.get(self.since, 1)
+        created = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        query = f"created:>{created}"
+        if self.language:
+            query = f"language:{self.language} " + query
+        return {"q": query, "sort": "stars", "order": "desc", "per_page": 25}
+
+    async def scrape(self) -> List[GitHubRepo]:
+        if not self.session:
+            raise RuntimeError("Session not initialized. Use 'async with' context manager.")
+
+        headers = {"Accept": "application/vnd.github+json"}
+        token = os.getenv("GITHUB_TOKEN")
+        if token:
+            headers["Authorization"] = f"bearer {token}"
+
+        try:
+            response = await self.session.get(self.BASE_URL,
+                                              params=self._build_params(),
+                                              headers=headers)
+            response.raise_for_status()
+            items = response.json().get("items", [])
+        except Exception as e:
+            print(f"API GET {self.language or 'all'} FAILED: {e}")
+            return []
+
+        return [
+            GitHubRepo(
+                name=item["full_name"],
+                url=item["html_url"],
+                description=item.get("description"),
+                stars=item.get("stargazers_count", 0),
+                forks=item.get("forks_count", 0),
+                language=item.get("language"),
+                today_stars=None
+            )
+            for item in items
+        ]
+
+def _parse_count(text: str) -> int:
+    """去掉逗号后就是纯数字（或"1.2k"），直接int/float转换，
+    顺带修掉旧逻辑把"1.2k"算成12000的问题"""
+    s = text.replace(",", "").strip()
+    if s.endswith("k"):
+        try:
+            return int(float(s[:-1]) * 1000)
+        except ValueError:
+            return 0
+    return int(s) if s.isdigit() else 0
+
+def _star_fields(text: str) -> Tuple[int, Optional[int]]:
+    """stargazers链接文本 -> (stars, today_stars)"""
+    if "stars today" in text:
+        today_match = text.split()
+        if today_match:
+            today_stars_text = today_match[0].replace(",", "")
+            return 0, int(today_stars_text) if today_stars_text.isdigit() else None
+        return 0, None
+    return _parse_count(text), None
+
+def _extract_counts(elements, get_text, get_href) -> Tuple[int, int, Optional[int]]:
+    """从Link--muted链接元素里提取star/fork/今日star数。
+
+    trending页面每篇article固定是两个muted链接（star前fork后）：
+    校验一次首链接的href就按位取值，不再逐个判断；
+    结构不符合预期时退回逐链接检查的通用循环。
+    """
+    elements = list(elements)
+    if len(elements) == 2 and "stargazers" in get_href(elements[0]):
+        stars, today_stars = _star_fields(get_text(elements[0]))
+        return stars, _parse_count(get_text(elements[1])), today_stars
+
+    stars = 0
+    forks = 0
+    today_stars = None
+
+    for elem in elements:
+        href = get_href(elem)
+        if "stargazers" in href:
+            s, t = _star_fields(get_text(elem))
+            if s:
+                stars = s
+            if t is not None:
+                today_stars = t
+        elif "forks" in href:
+            forks = _parse_count(get_text(elem))
+
+    return stars, forks, today_stars
+
+# 两套解析后端的文本/属性访问器
+def _sx_text(elem):
+    return elem.text(strip=True)
+
+def _sx_href(elem):
+    return elem.attributes.get("href") or ""
+
+def _bs4_text(elem):
+    return elem.get_text(strip=True)
+
+def _bs4_href(elem):
+    return elem.get("href", "")
+
+def _lx_text(elem):
+    # 把连续空白折叠成单个空格，对齐bs4 get_text(strip=True)的效果
+    return " ".join(elem.text_content().split())
+
+def _lx_href(elem):
+    return elem.get("href") or ""
+
+def _parse_repos_selectolax(html: str) -> List[GitHubRepo]:
+    """Lexbor快路径：整棵树留在C里，只把需要的字段取成Python对象"""
+    repos = []
+
+    for repo_element in LexborHTMLParser(html).css("article.Box-row"):
+        try:
+            link = repo_element.css_first("h2.h3 a")
+            if link is None:
+                continue
+
+            # href本身就是 /owner/repo，去掉前导斜杠即仓库名，
+            # 免去一次子树文本拼接
+            href = link.attributes.get("href", "")
+            repo_name = href[1:] if href.startswith("/") else href
+            repo_url = f"https://github.com{href}"
+
+            desc_element = repo_element.css_first("p.col-9")
+            description = desc_element.text(strip=True) if desc_element else None
+
+            lang_element = repo_element.css_first('span[itemprop="programmingLanguage"]')
+            language = lang_element.text(strip=True) if lang_element else None
+
+            stars, forks, today_stars = _extract_counts(
+                repo_element.css("a.Link--muted"), _sx_text, _sx_href)
+
+            repos.append(GitHubRepo(
+                name=repo_name,
+                url=repo_url,
+                description=description,
+                stars=stars,
+                forks=forks,
+                language=language,
+                today_stars=today_stars
+            ))
+
+        except Exception:
+            continue
+
+    return repos
+
+def _parse_repos_lxml(html: str) -> List[GitHubRepo]:
+    """lxml路径：预编译XPath在C层取节点，Python只迭代结果列表"""
+    doc = lxml_html.fromstring(html)
+    repos = []
+
+    for article in _X_ARTICLES(doc):
+        try:
+            links = _X_TITLE_LINK(article)
+            if not links:
+                continue
+            link = links[0]
+
+            href = _lx_href(link)
+            repo_name = href[1:] if href.startswith("/") else href
+            repo_url = f"https://github.com{href}"
+
+            descs = _X_DESC(article)
+            description = _lx_text(descs[0]) if descs else None
+
+            langs = _X_LANG(article)
+            language = _lx_text(langs[0]) if langs else None
+
+            stars, forks, today_stars = _extract_counts(
+                _X_MUTED(article), _lx_text, _lx_href)
+
+            repos.append(GitHubRepo(
+                name=repo_name,
+                url=repo_url,
+                description=description,
+                stars=stars,
+                forks=forks,
+                language=language,
+                today_stars=today_stars
+            ))
+
+        except Exception:
+            continue
+
+    return repos
+
+def _parse_repos_bs4(html: str) -> List[GitHubRepo]:
+    """bs4回退路径：selectolax不可用时维持原有行为"""
+    soup = BeautifulSoup(html, BS4_PARSER)
+    repos = []
+    repo_elements = soup.find_all("article", class_="Box-row")
+
+    for repo_element in repo_elements:
+        try:
+            # fetch repo name
+            # 组合选择器一次下降拿到链接，不用先找h2再找a
+            link = repo_element.select_one("h2.h3 > a")
+            if not link:
+                continue
+
+            href = link['href']
+            repo_name = href[1:] if href.startswith("/") else href
+            repo_url = f"https://github.com{href}"
+
+            # get description
+            desc_element = repo_element.find("p", class_="col-9")
+            description = desc_element.get_text(strip=True) if desc_element else None
+
+            # get programming language
+            lang_element = repo_element.find("span", itemprop="programmingLanguage")
+            language = lang_element.get_text(strip=True) if lang_element else None
+
+            # get starts and forks
+            # limit=2：找到两个链接就停，bs4不再继续扫子树
+            stars, forks, today_stars = _extract_counts(
+                repo_element.find_all("a", class_="Link--muted", limit=2),
+                _bs4_text, _bs4_href)
+
+            repo = GitHubRepo(
+                name=repo_name,
+                url=repo_url,
+                description=description,
+                stars=stars,
+                forks=forks,
+                language=language,
+                today_stars=today_stars
+            )
+
+            repos.append(repo)
+
+        except Exception as e:
+            continue
+
+    return repos
+
+async def scrape_single_language(
+    language: str,
+    since: str = "daily",
+    session: Optional[httpx.AsyncClient] = None,
+    sem: Optional[asyncio.BoundedSemaphore] = None,
+) -> Tuple[str, List[GitHubRepo]]:
+    """get single language trend"""
+    try:
+        if sem is None:
+            sem = asyncio.BoundedSemaphore(6)
+        async with sem:
+            async with GitHubTrendingScraper(language=language, since=since,
+                                             session=session) as scraper:
+                repos = await scraper.scrape()
+                return language, repos
+    except Exception as e:
+        print(f"爬取 {language} 时出错: {e}")
+        return language, []
+
+def _dump_ndjson_line(language: str, repos: List[GitHubRepo]) -> bytes:
+    """一种语言的结果编码成一行NDJSON"""
+    record = {
+        "language": language,
+        "repos": [{k: getattr(r, k) for k in _REPO_FIELDS} for r in repos]
+    }
+    if _HAS_ORJSON:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+async def concurrent_scrape(languages: List[str], since: str = "daily",
+                            stream_to: Optional[str] = None) -> dict:
+    """
+    并发爬取多种语言趋势
+
+    Args:
+        languages: 语言列表，如 ["python", "javascript", "go", "rust"]
+        since: 时间范围，可选 "daily", "weekly", "monthly"
+        stream_to: 可选的NDJSON输出路径，每种语言完成后立即追加一行
+
+    Returns:
+        字典格式: {语言: [仓库列表]}
+    """
+    print(f"开始并发爬取 {len(languages)} 种语言趋势...")
+
+    # 所有语言共用一个客户端：TLS握手/DNS只做一次，请求走同一个连接池；
+    # 有界信号量限制同时在飞的请求数
+    sem = asyncio.BoundedSemaphore(6)
+    all_results = {}
+    successful = 0
+    stream_file = open(stream_to, "wb") if stream_to else None
+
+    try:
+        async with _make_client() as session:
+            # create all scrape tasks
+            tasks = [scrape_single_language(lang, since, session=session, sem=sem)
+                     for lang in languages]
+
+            # as_completed：谁先完成先处理，快语言的序列化
+            # 与慢语言的抓取/解析重叠，不齐等最慢的那个
+            for coro in asyncio.as_completed(tasks):
+                language, repos = await coro
+                if repos:
+                    successful += 1
+                    all_results[language] = repos
+                    print(f"  ✓ {language}: scrape {len(repos)} repos")
+                    if stream_file:
+                        stream_file.write(_dump_ndjson_line(language, repos))
+                else:
+                    print(f"  ✗ {language}: failed or no data")
+    finally:
+        if stream_file:
+            stream_file.close()
+
+    print(f"Finished! Get {successful}/{len(languages)} languages")
+    return all_results
+
+def save_results_to_json(results: dict, filename: str = "github_trending_all.json",
+                         pretty: bool = False):
+    """save all results to json file
+
+    默认输出紧凑JSON（机器消费场景，体积约为缩进版的1/3）；
+    pretty=True时才带缩进。
+    """
+    output_data = {
+        "metadata": {
+            "fetched_at": datetime.now().isoformat(),
+            "total_languages": len(results),
+            "total_repos": sum(len(repos) for repos in results.values())
+        },
+        "data": {}
+    }
+    
+    for language, repos in results.items():
+        output_data["data"][language] = [
+            {k: getattr(repo, k) for k in _REPO_FIELDS}
+            for repo in repos
+        ]
+    
+    if _HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        Path(filename).write_bytes(orjson.dumps(output_data, option=option))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(output_data, f, indent=2 if pretty else None,
+                      ensure_ascii=False)
+
+    print(f"all data saved to {filename}")
+
+def _top_repos(repos: List[GitHubRepo], attr: str, n: int) -> List[GitHubRepo]:
+    """按单个整数属性取前n名（降序）"""
+    if _HAS_NUMPY and len(repos) > n:
+        values = np.fromiter((getattr(r, attr) or 0 for r in repos),
+                             dtype=np.int64, count=len(repos))
+        # argpartition只保证前n个是最大的，再对这n个排一次序
+        idx = np.argpartition(values, -n)[-n:]
+        idx = idx[np.argsort(values[idx])[::-1]]
+        return [repos[i] for i in idx]
+    return sorted(repos, key=lambda r: getattr(r, attr) or 0, reverse=True)[:n]
+
+def print_summary(results: dict, top_n: int = 5):
+    print("\n" + "="*60)
+    print("GitHub Trending multi-languages")
+    print("="*60)
+    
+    for language, repos in results.items():
+        if not repos:
+            continue
+            
+        print(f"\n【{language.upper()}】")
+        # Rank by Stars
+        repos_with_today = [r for r in repos if r.today_stars]
+        if repos_with_today:
+            sorted_repos = _top_repos(repos_with_today, "today_stars", top_n)
+            sort_by = "new stars today"
+        else:
+            sorted_repos = _top_repos(repos, "stars", top_n)
+            sort_by = "all stars"
+        
+        print(f"rank method: {sort_by}")
+        for i, repo in enumerate(sorted_repos, 1):
+            today_text = f"(tday +{repo.today_stars})" if repo.today_stars else ""
+            print(f"  {i:2d}. {repo.name:40} ⭐ {repo.stars:>6} {today_text:10}")
+
+async def main():
+    print("GitHub Trending multi-language")
+    print("-" * 40)
+    
+    # configure the languages to scrape
+    languages = ["python", "javascript", "go", "rust", "java", "typescript"]
+
+    # 先并发抓全部语言，Python的演示直接复用结果，
+    # 不再为例1单独多抓一次同一个页面
+    print(f"\n1. get {len(languages)} languages:")
+    all_results = await concurrent_scrape(languages, since="daily")
+
+    # example：show first 3 Python repos
+    python_repos = all_results.get("python", [])
+    print(f"\n2.  Python trend: {len(python_repos)} repos")
+    for i, repo in enumerate(python_repos[:3], 1):
+        print(f"     {i}. {repo.name} - {repo.stars} stars")
+    
+    # save results
+    save_results_to_json(all_results)
+    
+    # print summary
+    print_summary(all_results)
+    
+
+    total_repos = sum(len(repos) for repos in all_results.values())
+    print(f"\nTotal: {total_repos} repos ")